@@ -6,7 +6,7 @@ from aiida.common import InputValidationError, datastructures
 import aiida.common.folders
 from aiida.engine import CalcJob, CalcJobProcessSpec
 import aiida.engine.processes
-from aiida.orm import SinglefileData, Str, StructureData
+from aiida.orm import SinglefileData, Str, StructureData, to_aiida_type
 from ase.io import read, write
 
 from aiida_mlip.data.config import JanusConfigfile
@@ -117,6 +117,7 @@ class BaseJanus(CalcJob):  # numpydoc ignore=PR01
         spec.input(
             "arch",
             valid_type=Str,
+            serializer=to_aiida_type,
             required=False,
             help="Mlip architecture to use for calculation, defaults to mace",
         )
@@ -135,12 +136,14 @@ class BaseJanus(CalcJob):  # numpydoc ignore=PR01
         spec.input(
             "precision",
             valid_type=Str,
+            serializer=to_aiida_type,
             required=False,
             help="Precision level for calculation",
         )
         spec.input(
             "device",
             valid_type=Str,
+            serializer=to_aiida_type,
             required=False,
             help="Device on which to run calculation (cpu, cuda or mps)",
         )
@@ -148,6 +151,7 @@ class BaseJanus(CalcJob):  # numpydoc ignore=PR01
         spec.input(
             "log_filename",
             valid_type=Str,
+            serializer=to_aiida_type,
             required=False,
             default=lambda: Str(cls.LOG_FILE),
             help="Name of the log output file",
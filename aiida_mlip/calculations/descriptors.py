@@ -4,7 +4,7 @@ from aiida.common import datastructures
 import aiida.common.folders
 from aiida.engine import CalcJobProcessSpec
 import aiida.engine.processes
-from aiida.orm import Bool
+from aiida.orm import Bool, to_aiida_type
 
 from aiida_mlip.calculations.singlepoint import Singlepoint
 
@@ -41,6 +41,7 @@ class Descriptors(Singlepoint):  # numpydoc ignore=PR01
         spec.input(
             "invariants_only",
             valid_type=Bool,
+            serializer=to_aiida_type,
             required=False,
             help="Only calculate invariant descriptors.",
         )
@@ -48,6 +49,7 @@ class Descriptors(Singlepoint):  # numpydoc ignore=PR01
         spec.input(
             "calc_per_element",
             valid_type=Bool,
+            serializer=to_aiida_type,
             required=False,
             help="Calculate mean descriptors for each element.",
         )
@@ -55,6 +57,7 @@ class Descriptors(Singlepoint):  # numpydoc ignore=PR01
         spec.input(
             "calc_per_atom",
             valid_type=Bool,
+            serializer=to_aiida_type,
             required=False,
             help="Calculate descriptors for each atom.",
         )
@@ -13,6 +13,7 @@ from aiida.orm import (
     Str,
     StructureData,
     TrajectoryData,
+    to_aiida_type,
 )
 
 from aiida_mlip.calculations.singlepoint import Singlepoint
@@ -48,6 +49,7 @@ class GeomOpt(Singlepoint):  # numpydoc ignore=PR01
         spec.input(
             "traj",
             valid_type=Str,
+            serializer=to_aiida_type,
             required=False,
             default=lambda: Str(cls.DEFAULT_TRAJ_FILE),
             help="Path to save optimisation frames to",
@@ -55,18 +57,21 @@ class GeomOpt(Singlepoint):  # numpydoc ignore=PR01
         spec.input(
             "opt_cell_fully",
             valid_type=Bool,
+            serializer=to_aiida_type,
             required=False,
             help="Fully optimise the cell vectors, angles, and atomic positions",
         )
         spec.input(
             "opt_cell_lengths",
             valid_type=Bool,
+            serializer=to_aiida_type,
             required=False,
             help="Optimise cell vectors, as well as atomic positions",
         )
         spec.input(
             "fmax",
             valid_type=Float,
+            serializer=to_aiida_type,
             required=False,
             help="Maximum force for convergence",
         )
@@ -74,6 +79,7 @@ class GeomOpt(Singlepoint):  # numpydoc ignore=PR01
         spec.input(
             "steps",
             valid_type=Int,
+            serializer=to_aiida_type,
             required=False,
             help="Number of optimisation steps",
         )
@@ -81,6 +87,7 @@ class GeomOpt(Singlepoint):  # numpydoc ignore=PR01
         spec.input(
             "opt_kwargs",
             valid_type=Dict,
+            serializer=to_aiida_type,
             required=False,
             help="Other optimisation keywords",
         )
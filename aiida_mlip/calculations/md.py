@@ -4,7 +4,14 @@ from aiida.common import datastructures
 import aiida.common.folders
 from aiida.engine import CalcJobProcessSpec
 import aiida.engine.processes
-from aiida.orm import Dict, SinglefileData, Str, StructureData, TrajectoryData
+from aiida.orm import (
+    Dict,
+    SinglefileData,
+    Str,
+    StructureData,
+    TrajectoryData,
+    to_aiida_type,
+)
 
 from aiida_mlip.calculations.base import BaseJanus
 
@@ -41,6 +48,7 @@ class MD(BaseJanus):  # numpydoc ignore=PR01
         spec.input(
             "ensemble",
             valid_type=Str,
+            serializer=to_aiida_type,
             required=False,
             help="Name for thermodynamic ensemble",
         )
@@ -48,6 +56,7 @@ class MD(BaseJanus):  # numpydoc ignore=PR01
         spec.input(
             "md_kwargs",
             valid_type=Dict,
+            serializer=to_aiida_type,
             required=False,
             default=lambda: Dict(
                 {
@@ -4,7 +4,7 @@ from aiida.common import datastructures
 import aiida.common.folders
 from aiida.engine import CalcJobProcessSpec
 import aiida.engine.processes
-from aiida.orm import Dict, SinglefileData, Str
+from aiida.orm import Dict, SinglefileData, Str, to_aiida_type
 
 from aiida_mlip.calculations.base import BaseJanus
 
@@ -47,6 +47,7 @@ class Singlepoint(BaseJanus):  # numpydoc ignore=PR01
         spec.input(
             "out",
             valid_type=Str,
+            serializer=to_aiida_type,
             required=False,
             default=lambda: Str(cls.XYZ_OUTPUT),
             help="Name of the xyz output file",
@@ -55,6 +56,7 @@ class Singlepoint(BaseJanus):  # numpydoc ignore=PR01
         spec.input(
             "properties",
             valid_type=Str,
+            serializer=to_aiida_type,
             required=False,
             help="Properties to calculate",
         )
@@ -69,7 +71,6 @@ class Singlepoint(BaseJanus):  # numpydoc ignore=PR01
         )
         spec.output("xyz_output", valid_type=SinglefileData)
 
-        print("defining outputnode")
         spec.default_output_node = "results_dict"
 
     def prepare_for_submission(
@@ -7,7 +7,7 @@ from aiida.common import InputValidationError, datastructures
 import aiida.common.folders
 from aiida.engine import CalcJob, CalcJobProcessSpec
 import aiida.engine.processes
-from aiida.orm import Bool, Dict, FolderData, SinglefileData
+from aiida.orm import Bool, Dict, FolderData, SinglefileData, to_aiida_type
 
 from aiida_mlip.data.config import JanusConfigfile
 from aiida_mlip.data.model import ModelData
@@ -103,6 +103,7 @@ class Train(CalcJob):  # numpydoc ignore=PR01
         spec.input(
             "fine_tune",
             valid_type=Bool,
+            serializer=to_aiida_type,
             required=False,
             default=lambda: Bool(False),
             help="Whether fine-tuning a model",
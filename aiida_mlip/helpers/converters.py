@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Union
 
 from aiida.orm import Bool, Dict, Str, StructureData, TrajectoryData, load_code
-from ase.io import read
+from ase.io import iread
 import numpy as np
 
 from aiida_mlip.helpers.help_load import load_model, load_structure
@@ -48,11 +48,9 @@ def xyz_to_aiida_traj(
         A tuple containing the last structure in the trajectory and a `TrajectoryData`
         object containing all structures from the trajectory.
     """
-    # Read the XYZ file using ASE
-    struct_list = read(traj_file, index=":")
-
-    # Create a TrajectoryData object
-    traj = [StructureData(ase=struct) for struct in struct_list]
+    # Stream the XYZ file frame by frame using ASE, so that only the converted
+    # structures are held in memory rather than an extra list of `Atoms`
+    traj = [StructureData(ase=struct) for struct in iread(traj_file, index=":")]
 
     return traj[-1], TrajectoryData(traj)
 
@@ -96,7 +96,6 @@ class MDParser(BaseParser):
 
         # Process summary as both singlefiledata and results dictionary
         summary_filepath = md_dictionary.get("summary", MD.DEFAULT_SUMMARY_FILE)
-        print(self.node.get_remote_workdir(), summary_filepath)
         with self.retrieved.open(summary_filepath, "rb") as handle:
             self.out("summary", SinglefileData(file=handle, filename=summary_filepath))
 
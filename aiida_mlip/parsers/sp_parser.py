@@ -1,7 +1,5 @@
 """Parsers provided by aiida_mlip."""
 
-from pathlib import Path
-
 from aiida.common import exceptions
 from aiida.engine import ExitCode
 from aiida.orm import Dict, SinglefileData
@@ -94,9 +92,9 @@ class SPParser(BaseParser):
         with self.retrieved.open(xyz_output, "rb") as handle:
             self.out("xyz_output", SinglefileData(file=handle, filename=xyz_output))
 
-        content = read(
-            Path(self.node.get_remote_workdir(), xyz_output), format="extxyz"
-        )
+        # Read results from the retrieved file rather than the remote working directory
+        with self.retrieved.open(xyz_output, "r") as handle:
+            content = read(handle, format="extxyz")
         results = convert_numpy(content.todict())
         results_node = Dict(results)
         self.out("results_dict", results_node)
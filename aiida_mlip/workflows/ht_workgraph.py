@@ -4,12 +4,10 @@ from pathlib import Path
 from typing import Callable, Union
 
 from aiida.engine import CalcJob, WorkChain
-from aiida.orm import Str
+from aiida.orm import Str, StructureData
 from aiida_workgraph import WorkGraph, task
 from ase.io import read
 
-from aiida_mlip.helpers.help_load import load_structure
-
 
 @task.graph_builder(outputs=[{"name": "final_structures", "from": "context.structs"}])
 def build_ht_calc(
@@ -64,10 +62,11 @@ def build_ht_calc(
     pattern = "**/*" if recursive else "*"
     for file in filter(Path.is_file, folder.glob(pattern)):
         try:
-            read(file)
+            atoms = read(file)
         except Exception:
             continue
-        structure = load_structure(file)
+        # Reuse the parsed structure rather than reading the file a second time
+        structure = StructureData(ase=atoms)
         calc_inputs[input_struct_key] = structure
         calc_task = wg.add_task(
             calc,
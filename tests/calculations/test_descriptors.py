@@ -1,31 +1,18 @@
 """Tests for descriptors calculation."""
 
-import subprocess
-
 from aiida.common import datastructures
 from aiida.engine import run
-from aiida.orm import Bool, Str, StructureData
 from aiida.plugins import CalculationFactory
-from ase.build import bulk
+from click.testing import CliRunner
 import pytest
 
-from aiida_mlip.data.model import ModelData
+DescriptorsCalc = CalculationFactory("mlip.descriptors")
 
 
-def test_descriptors(fixture_sandbox, generate_calc_job, janus_code, model_folder):
+def test_descriptors(fixture_sandbox, generate_calc_job, janus_inputs):
     """Test generating descriptors calculation job."""
     entry_point_name = "mlip.descriptors"
-    model_file = model_folder / "mace_mp_small.model"
-    inputs = {
-        "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "code": janus_code,
-        "arch": Str("mace"),
-        "precision": Str("float64"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
-        "model": ModelData.from_local(model_file, architecture="mace"),
-        "device": Str("cpu"),
-        "invariants_only": Bool(True),
-    }
+    inputs = {**janus_inputs, "invariants_only": True}
 
     calc_info = generate_calc_job(fixture_sandbox, entry_point_name, inputs)
 
@@ -54,35 +41,26 @@ def test_descriptors(fixture_sandbox, generate_calc_job, janus_code, model_folde
     ]
 
     # Check the attributes of the returned `CalcInfo`
-    assert sorted(fixture_sandbox.get_content_list()) == sorted(
-        ["aiida.xyz", "mlff.model"]
-    )
+    assert set(fixture_sandbox.get_content_list()) == {"aiida.xyz", "mlff.model"}
     assert isinstance(calc_info, datastructures.CalcInfo)
     assert isinstance(calc_info.codes_info[0], datastructures.CodeInfo)
     assert len(calc_info.codes_info[0].cmdline_params) == len(cmdline_params)
     assert sorted(map(str, calc_info.codes_info[0].cmdline_params)) == sorted(
         map(str, cmdline_params)
     )
-    assert sorted(calc_info.retrieve_list) == sorted(retrieve_list)
+    assert set(calc_info.retrieve_list) == set(retrieve_list)
 
 
-def test_run_descriptors(model_folder, janus_code):
+@pytest.mark.slow
+def test_run_descriptors(janus_inputs):
     """Test running descriptors calculation."""
-    model_file = model_folder / "mace_mp_small.model"
     inputs = {
-        "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "code": janus_code,
-        "arch": Str("mace"),
-        "precision": Str("float64"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
-        "model": ModelData.from_local(model_file, architecture="mace"),
-        "device": Str("cpu"),
-        "invariants_only": Bool(False),
-        "calc_per_element": Bool(True),
-        "calc_per_atom": Bool(True),
+        **janus_inputs,
+        "invariants_only": False,
+        "calc_per_element": True,
+        "calc_per_atom": True,
     }
 
-    DescriptorsCalc = CalculationFactory("mlip.descriptors")
     result = run(DescriptorsCalc, **inputs)
 
     assert "xyz_output" in result
@@ -96,20 +74,22 @@ def test_run_descriptors(model_folder, janus_code):
     assert obtained_res["mace_descriptors"] == pytest.approx([-0.00207855, -0.00919008])
 
 
-def test_example_descriptors(example_path, janus_code):
+@pytest.mark.slow
+def test_example_descriptors(example_cli, janus_code, model_folder):
     """Test running descriptors calculation using the example file provided."""
-    example_file_path = example_path / "submit_descriptors.py"
-    command = [
-        "verdi",
-        "run",
-        example_file_path,
-        f"{janus_code.label}@{janus_code.computer.label}",
-    ]
-
-    # Execute the command
-    result = subprocess.run(command, capture_output=True, text=True, check=False)
-    assert result.stderr == ""
-    assert result.returncode == 0
-    assert "results from calculation:" in result.stdout
-    assert "'results_dict': <Dict: uuid:" in result.stdout
-    assert "'xyz_output': <SinglefileData: uuid:" in result.stdout
+    cli = example_cli("submit_descriptors.py")
+
+    # Invoke the example in the current process, rather than through `verdi run`
+    result = CliRunner().invoke(
+        cli,
+        [
+            f"{janus_code.label}@{janus_code.computer.label}",
+            "--model",
+            str(model_folder / "mace_mp_small.model"),
+        ],
+    )
+    assert result.exception is None
+    assert result.exit_code == 0
+    assert "results from calculation:" in result.output
+    assert "'results_dict': <Dict: uuid:" in result.output
+    assert "'xyz_output': <SinglefileData: uuid:" in result.output
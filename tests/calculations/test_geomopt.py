@@ -1,89 +1,66 @@
 """Tests for geometry optimisation calculation."""
 
-import subprocess
+from collections import Counter
 
 from aiida.common import datastructures
 from aiida.engine import run
-from aiida.orm import Bool, Float, Int, Str, StructureData
 from aiida.plugins import CalculationFactory
-from ase.build import bulk
+from click.testing import CliRunner
 import pytest
 
-from aiida_mlip.data.model import ModelData
+GeomoptCalc = CalculationFactory("mlip.opt")
 
+GEOMOPT_CMDLINE = (
+    "geomopt",
+    "--arch",
+    "mace",
+    "--struct",
+    "aiida.xyz",
+    "--device",
+    "cpu",
+    "--log",
+    "aiida.log",
+    "--out",
+    "aiida-results.xyz",
+    "--calc-kwargs",
+    "{'default_dtype': 'float64', 'model': 'mlff.model'}",
+    "--traj",
+    "aiida-traj.xyz",
+)
 
-def test_geomopt(fixture_sandbox, generate_calc_job, janus_code, model_folder):
-    """Test generating geomopt calculation job."""
-    entry_point_name = "mlip.opt"
-    model_file = model_folder / "mace_mp_small.model"
-    inputs = {
-        "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "code": janus_code,
-        "arch": Str("mace"),
-        "precision": Str("float64"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
-        "model": ModelData.from_local(model_file, architecture="mace"),
-        "device": Str("cpu"),
-    }
-
-    calc_info = generate_calc_job(fixture_sandbox, entry_point_name, inputs)
+GEOMOPT_RETRIEVE = (
+    "aiida.log",
+    "aiida-results.xyz",
+    "aiida-stdout.txt",
+    "aiida-traj.xyz",
+)
 
-    cmdline_params = [
-        "geomopt",
-        "--arch",
-        "mace",
-        "--struct",
-        "aiida.xyz",
-        "--device",
-        "cpu",
-        "--log",
-        "aiida.log",
-        "--out",
-        "aiida-results.xyz",
-        "--calc-kwargs",
-        "{'default_dtype': 'float64', 'model': 'mlff.model'}",
-        "--traj",
-        "aiida-traj.xyz",
-    ]
 
-    retrieve_list = [
-        calc_info.uuid,
-        "aiida.log",
-        "aiida-results.xyz",
-        "aiida-stdout.txt",
-        "aiida-traj.xyz",
-    ]
+def test_geomopt(fixture_sandbox, generate_calc_job, janus_inputs):
+    """Test generating geomopt calculation job."""
+    entry_point_name = "mlip.opt"
+    calc_info = generate_calc_job(fixture_sandbox, entry_point_name, janus_inputs)
 
     # Check the attributes of the returned `CalcInfo`
-    assert sorted(fixture_sandbox.get_content_list()) == sorted(
-        ["aiida.xyz", "mlff.model"]
-    )
+    assert set(fixture_sandbox.get_content_list()) == {"aiida.xyz", "mlff.model"}
     assert isinstance(calc_info, datastructures.CalcInfo)
     assert isinstance(calc_info.codes_info[0], datastructures.CodeInfo)
-    assert len(calc_info.codes_info[0].cmdline_params) == len(cmdline_params)
-    assert sorted(map(str, calc_info.codes_info[0].cmdline_params)) == sorted(
-        map(str, cmdline_params)
+    assert Counter(map(str, calc_info.codes_info[0].cmdline_params)) == Counter(
+        GEOMOPT_CMDLINE
     )
-    assert sorted(calc_info.retrieve_list) == sorted(retrieve_list)
+    assert set(calc_info.retrieve_list) == {calc_info.uuid, *GEOMOPT_RETRIEVE}
 
 
-def test_run_opt(model_folder, janus_code):
+@pytest.mark.slow
+def test_run_opt(janus_inputs):
     """Test running geomopt calculation."""
-    model_file = model_folder / "mace_mp_small.model"
     inputs = {
-        "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "code": janus_code,
-        "arch": Str("mace"),
-        "precision": Str("float64"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
-        "model": ModelData.from_local(model_file, architecture="mace"),
-        "device": Str("cpu"),
-        "opt_cell_fully": Bool(True),
-        "fmax": Float(0.1),
-        "steps": Int(1000),
+        **janus_inputs,
+        "opt_cell_fully": True,
+        "fmax": 0.1,
+        "steps": 100,
     }
 
-    GeomoptCalc = CalculationFactory("mlip.opt")
     result = run(GeomoptCalc, **inputs)
     assert "results_dict" in result
     assert "final_structure" in result
@@ -94,20 +71,25 @@ def test_run_opt(model_folder, janus_code):
     assert result["xyz_output"].filename == "aiida-results.xyz"
 
 
-def test_example_opt(example_path, janus_code):
+@pytest.mark.slow
+def test_example_opt(example_cli, janus_code, model_folder):
     """Test function to run geometry optimization using the example file provided."""
-    example_file_path = example_path / "submit_geomopt.py"
-    command = [
-        "verdi",
-        "run",
-        example_file_path,
-        f"{janus_code.label}@{janus_code.computer.label}",
-    ]
+    cli = example_cli("submit_geomopt.py")
 
-    # Execute the command
-    result = subprocess.run(command, capture_output=True, text=True, check=False)
-    assert result.stderr == ""
-    assert result.returncode == 0
-    assert "results from calculation:" in result.stdout
-    assert "'traj_file': <SinglefileData: uuid:" in result.stdout
-    assert "'final_structure': <StructureData: uuid:" in result.stdout
+    # Invoke the example in the current process, rather than through `verdi run`
+    # The test only checks the outputs exist, so a loose convergence is enough
+    result = CliRunner().invoke(
+        cli,
+        [
+            f"{janus_code.label}@{janus_code.computer.label}",
+            "--model",
+            str(model_folder / "mace_mp_small.model"),
+            "--fmax",
+            "0.5",
+        ],
+    )
+    assert result.exception is None
+    assert result.exit_code == 0
+    assert "results from calculation:" in result.output
+    assert "'traj_file': <SinglefileData: uuid:" in result.output
+    assert "'final_structure': <StructureData: uuid:" in result.output
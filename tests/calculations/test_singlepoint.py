@@ -1,114 +1,90 @@
 """Tests for singlepoint calculation."""
 
+from collections import Counter
 import subprocess
 
 from aiida.common import InputValidationError, datastructures
 from aiida.engine import run
-from aiida.orm import Str, StructureData
 from aiida.plugins import CalculationFactory
-from ase.build import bulk
 import pytest
 
-from aiida_mlip.data.config import JanusConfigfile
 from aiida_mlip.data.model import ModelData
 
-
-def test_singlepoint(fixture_sandbox, generate_calc_job, janus_code, model_folder):
+SinglepointCalc = CalculationFactory("mlip.sp")
+
+SP_CMDLINE = (
+    "singlepoint",
+    "--arch",
+    "mace",
+    "--struct",
+    "aiida.xyz",
+    "--device",
+    "cpu",
+    "--log",
+    "aiida.log",
+    "--out",
+    "aiida-results.xyz",
+    "--calc-kwargs",
+    "{'default_dtype': 'float64', 'model': 'mlff.model'}",
+)
+
+SP_RETRIEVE = (
+    "aiida.log",
+    "aiida-results.xyz",
+    "aiida-stdout.txt",
+)
+
+
+def test_singlepoint(fixture_sandbox, generate_calc_job, janus_inputs):
     """Test generating singlepoint calculation job."""
     entry_point_name = "mlip.sp"
-    model_file = model_folder / "mace_mp_small.model"
-    inputs = {
-        "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "code": janus_code,
-        "arch": Str("mace"),
-        "precision": Str("float64"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
-        "model": ModelData.from_local(model_file, architecture="mace"),
-        "device": Str("cpu"),
-    }
-
-    calc_info = generate_calc_job(fixture_sandbox, entry_point_name, inputs)
-
-    cmdline_params = [
-        "singlepoint",
-        "--arch",
-        "mace",
-        "--struct",
-        "aiida.xyz",
-        "--device",
-        "cpu",
-        "--log",
-        "aiida.log",
-        "--out",
-        "aiida-results.xyz",
-        "--calc-kwargs",
-        "{'default_dtype': 'float64', 'model': 'mlff.model'}",
-    ]
-
-    retrieve_list = [
-        calc_info.uuid,
-        "aiida.log",
-        "aiida-results.xyz",
-        "aiida-stdout.txt",
-    ]
+    calc_info = generate_calc_job(fixture_sandbox, entry_point_name, janus_inputs)
 
     # Check the attributes of the returned `CalcInfo`
-    assert sorted(fixture_sandbox.get_content_list()) == sorted(
-        ["aiida.xyz", "mlff.model"]
-    )
+    assert set(fixture_sandbox.get_content_list()) == {"aiida.xyz", "mlff.model"}
     assert isinstance(calc_info, datastructures.CalcInfo)
     assert isinstance(calc_info.codes_info[0], datastructures.CodeInfo)
-    assert sorted(calc_info.codes_info[0].cmdline_params) == sorted(cmdline_params)
-    assert sorted(calc_info.retrieve_list) == sorted(retrieve_list)
+    assert Counter(map(str, calc_info.codes_info[0].cmdline_params)) == Counter(
+        SP_CMDLINE
+    )
+    assert set(calc_info.retrieve_list) == {calc_info.uuid, *SP_RETRIEVE}
 
 
-def test_sp_nostruct(fixture_sandbox, generate_calc_job, model_folder, janus_code):
+def test_sp_nostruct(fixture_sandbox, generate_calc_job, janus_inputs):
     """Test singlepoint calculation with error input."""
     entry_point_name = "mlip.sp"
-    model_file = model_folder / "mace_mp_small.model"
-    inputs = {
-        "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "code": janus_code,
-        "arch": Str("mace"),
-        "precision": Str("float64"),
-        "model": ModelData.from_local(model_file, architecture="mace"),
-        "device": Str("cpu"),
-    }
-    with pytest.raises(InputValidationError):
-        generate_calc_job(fixture_sandbox, entry_point_name, inputs)
-
-
-def test_sp_nomodel(fixture_sandbox, generate_calc_job, config_folder, janus_code):
-    """Test singlepoint calculation with missing model."""
-    entry_point_name = "mlip.sp"
-
-    inputs = {
-        "code": janus_code,
-        "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "config": JanusConfigfile(config_folder / "config_nomodel.yml"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
-    }
-
+    inputs = {**janus_inputs}
+    del inputs["struct"]
     with pytest.raises(InputValidationError):
         generate_calc_job(fixture_sandbox, entry_point_name, inputs)
 
 
-def test_sp_noarch(fixture_sandbox, generate_calc_job, config_folder, janus_code):
-    """Test singlepoint calculation with missing architecture."""
+@pytest.mark.parametrize("config_file", ["config_nomodel.yml", "config_noarch.yml"])
+def test_sp_incomplete_config(
+    fixture_sandbox,
+    generate_calc_job,
+    janus_config,
+    janus_code,
+    nacl_structure,
+    config_file,
+):
+    """Test singlepoint calculation with missing model or architecture in config."""
     entry_point_name = "mlip.sp"
 
     inputs = {
         "code": janus_code,
         "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "config": JanusConfigfile(config_folder / "config_noarch.yml"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
+        "config": janus_config(config_file),
+        "struct": nacl_structure,
     }
 
     with pytest.raises(InputValidationError):
         generate_calc_job(fixture_sandbox, entry_point_name, inputs)
 
 
-def test_two_arch(fixture_sandbox, generate_calc_job, model_folder, janus_code):
+def test_two_arch(
+    fixture_sandbox, generate_calc_job, model_folder, janus_code, nacl_structure
+):
     """Test singlepoint calculation with two defined architectures."""
     entry_point_name = "mlip.sp"
     model_file = model_folder / "mace_mp_small.model"
@@ -117,29 +93,18 @@ def test_two_arch(fixture_sandbox, generate_calc_job, model_folder, janus_code):
         "code": janus_code,
         "metadata": {"options": {"resources": {"num_machines": 1}}},
         "model": ModelData.from_local(model_file, architecture="mace_mp"),
-        "arch": Str("chgnet"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
+        "arch": "chgnet",
+        "struct": nacl_structure,
     }
 
     with pytest.raises(InputValidationError):
         generate_calc_job(fixture_sandbox, entry_point_name, inputs)
 
 
-def test_run_sp(model_folder, janus_code):
+@pytest.mark.slow
+def test_run_sp(janus_inputs):
     """Test running singlepoint calculation."""
-    model_file = model_folder / "mace_mp_small.model"
-    inputs = {
-        "metadata": {"options": {"resources": {"num_machines": 1}}},
-        "code": janus_code,
-        "arch": Str("mace"),
-        "precision": Str("float64"),
-        "struct": StructureData(ase=bulk("NaCl", "rocksalt", 5.63)),
-        "model": ModelData.from_local(model_file, architecture="mace"),
-        "device": Str("cpu"),
-    }
-
-    SinglepointCalc = CalculationFactory("mlip.sp")
-    result = run(SinglepointCalc, **inputs)
+    result = run(SinglepointCalc, **janus_inputs)
     assert "results_dict" in result
     obtained_res = result["results_dict"].get_dict()
     assert "xyz_output" in result
@@ -147,14 +112,18 @@ def test_run_sp(model_folder, janus_code):
     assert obtained_res["info"]["mace_stress"][0] == pytest.approx(-0.005816546985101)
 
 
-def test_example(example_path, janus_code):
+@pytest.mark.slow
+def test_example(example_path, janus_code, model_folder):
     """Test function to run singlepoint calculation using the example file provided."""
     example_file_path = example_path / "submit_singlepoint.py"
+    # Run the script through `verdi run`, to also cover its command line entry point
     command = [
         "verdi",
         "run",
         example_file_path,
         f"{janus_code.label}@{janus_code.computer.label}",
+        "--model",
+        model_folder / "mace_mp_small.model",
     ]
 
     # Execute the command
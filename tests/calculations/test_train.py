@@ -9,12 +9,13 @@ import pytest
 from aiida_mlip.data.config import JanusConfigfile
 from aiida_mlip.data.model import ModelData
 
+FinetuneCalc = CalculationFactory("mlip.train")
 
-def test_prepare_train(fixture_sandbox, generate_calc_job, janus_code, config_folder):
+
+def test_prepare_train(fixture_sandbox, generate_calc_job, janus_code, janus_config):
     """Test generating singlepoint calculation job."""
     entry_point_name = "mlip.train"
-    config_path = config_folder / "mlip_train.yml"
-    config = JanusConfigfile(file=config_path)
+    config = janus_config("mlip_train.yml")
     inputs = {
         "metadata": {"options": {"resources": {"num_machines": 1}}},
         "code": janus_code,
@@ -37,7 +38,7 @@ def test_prepare_train(fixture_sandbox, generate_calc_job, janus_code, config_fo
     assert fixture_sandbox.get_content_list() == ["mlip_train.yml"]
     assert isinstance(calc_info, datastructures.CalcInfo)
     assert isinstance(calc_info.codes_info[0], datastructures.CodeInfo)
-    assert sorted(calc_info.retrieve_list) == sorted(retrieve_list)
+    assert set(calc_info.retrieve_list) == set(retrieve_list)
 
 
 def test_file_error(
@@ -47,7 +48,7 @@ def test_file_error(
     entry_point_name = "mlip.train"
     config_path = config_folder / "mlip_train.yml"
 
-    # Temporarily modify config file to introduce an error
+    # Write a copy of the config file with a non-existent xyz path
     with open(config_path, encoding="utf-8") as file:
         right_path = file.read()
 
@@ -73,7 +74,7 @@ def test_noname(
     entry_point_name = "mlip.train"
     config_path = config_folder / "mlip_train.yml"
 
-    # Temporarily modify config file to introduce an error
+    # Write a copy of the config file without the 'name' keyword
     with open(config_path, encoding="utf-8") as file:
         original_lines = file.readlines()
 
@@ -92,17 +93,14 @@ def test_noname(
     with pytest.raises(InputValidationError):
         generate_calc_job(fixture_sandbox, entry_point_name, inputs)
 
-    # Restore config file
-    with open(config_path, "w", encoding="utf-8") as file:
-        file.writelines(original_lines)
 
-
-def test_prepare_tune(fixture_sandbox, generate_calc_job, janus_code, config_folder):
+def test_prepare_tune(
+    fixture_sandbox, generate_calc_job, janus_code, config_folder, janus_config
+):
     """Test generating fine tuning calculation job."""
     model_file = config_folder / "test.model"
     entry_point_name = "mlip.train"
-    config_path = config_folder / "mlip_train.yml"
-    config = JanusConfigfile(file=config_path)
+    config = janus_config("mlip_train.yml")
     inputs = {
         "metadata": {"options": {"resources": {"num_machines": 1}}},
         "code": janus_code,
@@ -128,20 +126,17 @@ def test_prepare_tune(fixture_sandbox, generate_calc_job, janus_code, config_fol
     ]
 
     # Check the attributes of the returned `CalcInfo`
-    assert sorted(fixture_sandbox.get_content_list()) == sorted(
-        ["mlip_train.yml", "mlff.model"]
-    )
+    assert set(fixture_sandbox.get_content_list()) == {"mlip_train.yml", "mlff.model"}
     assert isinstance(calc_info, datastructures.CalcInfo)
     assert isinstance(calc_info.codes_info[0], datastructures.CodeInfo)
-    assert sorted(calc_info.retrieve_list) == sorted(retrieve_list)
+    assert set(calc_info.retrieve_list) == set(retrieve_list)
     assert calc_info.codes_info[0].cmdline_params == cmdline_params
 
 
-def test_finetune_error(fixture_sandbox, generate_calc_job, janus_code, config_folder):
+def test_finetune_error(fixture_sandbox, generate_calc_job, janus_code, janus_config):
     """Test error if no model is given."""
     entry_point_name = "mlip.train"
-    config_path = config_folder / "mlip_train.yml"
-    config = JanusConfigfile(file=config_path)
+    config = janus_config("mlip_train.yml")
     inputs = {
         "metadata": {"options": {"resources": {"num_machines": 1}}},
         "fine_tune": Bool(True),
@@ -153,11 +148,11 @@ def test_finetune_error(fixture_sandbox, generate_calc_job, janus_code, config_f
         generate_calc_job(fixture_sandbox, entry_point_name, inputs)
 
 
-def test_run_train(janus_code, config_folder):
+@pytest.mark.slow
+def test_run_train(janus_code, config_folder, janus_config):
     """Test running train with fine-tuning calculation."""
     model_file = config_folder / "test.model"
-    config_path = config_folder / "mlip_train.yml"
-    config = JanusConfigfile(file=config_path)
+    config = janus_config("mlip_train.yml")
     inputs = {
         "metadata": {"options": {"resources": {"num_machines": 1}}},
         "fine_tune": Bool(True),
@@ -168,7 +163,6 @@ def test_run_train(janus_code, config_folder):
         ),
     }
 
-    FinetuneCalc = CalculationFactory("mlip.train")
     result = run(FinetuneCalc, **inputs)
 
     assert "results_dict" in result
@@ -1,5 +1,6 @@
 """Initialise a text database and profile for pytest."""
 
+import importlib.util
 import os
 from pathlib import Path
 import shutil
@@ -8,10 +9,14 @@ from aiida.common import exceptions
 from aiida.common.folders import SandboxFolder
 from aiida.engine.utils import instantiate_process
 from aiida.manage.manager import get_manager
-from aiida.orm import InstalledCode, load_code
+from aiida.orm import InstalledCode, StructureData, load_code
 from aiida.plugins import CalculationFactory
+from ase.build import bulk
 import pytest
 
+from aiida_mlip.data.config import JanusConfigfile
+from aiida_mlip.data.model import ModelData
+
 pytest_plugins = ["aiida.manage.tests.pytest_fixtures"]
 
 
@@ -79,6 +84,37 @@ def fixture_localhost(aiida_localhost):
     return localhost
 
 
+@pytest.fixture(scope="session")
+def nacl_atoms():
+    """
+    Fixture to build the NaCl rocksalt structure shared by the tests.
+
+    Returns
+    -------
+    ase.Atoms
+        NaCl rocksalt structure with lattice constant 5.63.
+    """
+    return bulk("NaCl", "rocksalt", 5.63)
+
+
+@pytest.fixture
+def nacl_structure(nacl_atoms):
+    """
+    Fixture to wrap the shared NaCl structure as a `StructureData` node.
+
+    Parameters
+    ----------
+    nacl_atoms : fixture
+        A fixture providing the NaCl `Atoms`.
+
+    Returns
+    -------
+    StructureData
+        NaCl rocksalt structure as an unstored `StructureData` node.
+    """
+    return StructureData(ase=nacl_atoms)
+
+
 @pytest.fixture(scope="function")
 def janus_code(aiida_local_code_factory):
     """
@@ -216,6 +252,47 @@ def example_path(test_folder):
     return test_folder.parent / "examples" / "calculations"
 
 
+@pytest.fixture(scope="session")
+def example_cli(example_path):
+    """
+    Return a function to load the click interface of an example file.
+
+    Parameters
+    ----------
+    example_path : fixture
+        A fixture providing the path to the example files.
+
+    Notes
+    -----
+    Loading the interface lets the example be invoked in the same process as the
+    tests, reusing the loaded AiiDA profile rather than starting `verdi run`.
+    """
+
+    def _example_cli(filename):
+        """
+        Load the `cli` click command defined in an example file.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the example file.
+
+        Returns
+        -------
+        click.Command
+            The click interface of the example.
+        """
+        example_file_path = example_path / filename
+        spec = importlib.util.spec_from_file_location(
+            example_file_path.stem, example_file_path
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.cli
+
+    return _example_cli
+
+
 @pytest.fixture(scope="session")
 def model_folder(test_folder):
     """
@@ -228,6 +305,58 @@ def model_folder(test_folder):
     return test_folder / "data" / "input_files" / "mace"
 
 
+@pytest.fixture
+def mace_model(model_folder):
+    """
+    Fixture to provide the small MACE model as a `ModelData` node.
+
+    Parameters
+    ----------
+    model_folder : fixture
+        A fixture providing the path to the folder containing the model.
+
+    Returns
+    -------
+    ModelData
+        The MACE model with "mace" architecture.
+    """
+    return ModelData.from_local(
+        model_folder / "mace_mp_small.model", architecture="mace"
+    )
+
+
+@pytest.fixture
+def janus_inputs(janus_code, mace_model, nacl_structure):
+    """
+    Fixture to provide the inputs shared by the janus calculations.
+
+    Tests can extend or override these, e.g. ``{**janus_inputs, "steps": 100}``.
+
+    Parameters
+    ----------
+    janus_code : fixture
+        A fixture providing the janus code.
+    mace_model : fixture
+        A fixture providing the small MACE model.
+    nacl_structure : fixture
+        A fixture providing the NaCl structure.
+
+    Returns
+    -------
+    dict
+        Inputs for running the small MACE model on NaCl on the cpu.
+    """
+    return {
+        "metadata": {"options": {"resources": {"num_machines": 1}}},
+        "code": janus_code,
+        "arch": "mace",
+        "precision": "float64",
+        "struct": nacl_structure,
+        "model": mace_model,
+        "device": "cpu",
+    }
+
+
 @pytest.fixture(scope="session")
 def structure_folder(test_folder):
     """
@@ -274,3 +403,33 @@ def config_folder(test_folder):
         Path: The path to the example file.
     """
     return test_folder / "calculations" / "configs"
+
+
+@pytest.fixture
+def janus_config(config_folder):
+    """
+    Return a function to get `JanusConfigfile` nodes for the test config files.
+
+    Parameters
+    ----------
+    config_folder : fixture
+        A fixture providing the path to the folder containing the config files.
+    """
+
+    def _janus_config(filename):
+        """
+        Create a `JanusConfigfile` for a file in the test config folder.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the config file in the config folder.
+
+        Returns
+        -------
+        JanusConfigfile
+            The config file node.
+        """
+        return JanusConfigfile(file=config_folder / filename)
+
+    return _janus_config
@@ -4,17 +4,17 @@ from aiida.orm import SinglefileData, StructureData
 from aiida.plugins import CalculationFactory
 import pytest
 
-from aiida_mlip.data.model import ModelData
 from aiida_mlip.workflows.ht_workgraph import get_ht_workgraph
 
+SinglepointCalc = CalculationFactory("mlip.sp")
+GeomoptCalc = CalculationFactory("mlip.opt")
 
-def test_ht_singlepoint(janus_code, workflow_structure_folder, model_folder) -> None:
-    """Test high throughput singlepoint calculation."""
-    SinglepointCalc = CalculationFactory("mlip.sp")
 
-    model_file = model_folder / "mace_mp_small.model"
+@pytest.mark.slow
+def test_ht_singlepoint(janus_code, workflow_structure_folder, mace_model) -> None:
+    """Test high throughput singlepoint calculation."""
     inputs = {
-        "model": ModelData.from_local(model_file, architecture="mace"),
+        "model": mace_model,
         "metadata": {"options": {"resources": {"num_machines": 1}}},
         "code": janus_code,
     }
@@ -34,13 +34,10 @@ def test_ht_singlepoint(janus_code, workflow_structure_folder, model_folder) ->
     assert isinstance(wg.process.outputs.final_structures.methane, SinglefileData)
 
 
-def test_ht_invalid_path(janus_code, workflow_invalid_folder, model_folder) -> None:
+def test_ht_invalid_path(janus_code, workflow_invalid_folder, mace_model) -> None:
     """Test invalid path for high throughput calculation."""
-    SinglepointCalc = CalculationFactory("mlip.sp")
-
-    model_file = model_folder / "mace_mp_small.model"
     inputs = {
-        "model": ModelData.from_local(model_file, architecture="mace"),
+        "model": mace_model,
         "metadata": {"options": {"resources": {"num_machines": 1}}},
         "code": janus_code,
     }
@@ -56,13 +53,11 @@ def test_ht_invalid_path(janus_code, workflow_invalid_folder, model_folder) -> N
         wg.run()
 
 
-def test_ht_geomopt(janus_code, workflow_structure_folder, model_folder) -> None:
+@pytest.mark.slow
+def test_ht_geomopt(janus_code, workflow_structure_folder, mace_model) -> None:
     """Test high throughput geometry optimisation."""
-    GeomoptCalc = CalculationFactory("mlip.opt")
-
-    model_file = model_folder / "mace_mp_small.model"
     inputs = {
-        "model": ModelData.from_local(model_file, architecture="mace"),
+        "model": mace_model,
         "metadata": {"options": {"resources": {"num_machines": 1}}},
         "code": janus_code,
     }